@@ -0,0 +1,126 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class CassetteMissError(Exception):
+    pass
+
+
+class Cassette:
+    """Records request/response pairs with timing and replays them.
+
+    Each distinct request is stored in its own JSON file as a list of
+    interactions. Repeated identical requests (e.g. indexing probes) replay
+    their recordings in order and then keep returning the last one.
+    """
+
+    def __init__(self, directory: str, mode: str, latency_scale: float = 1.0):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._replay_positions = {}
+        if mode == RECORD:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, namespace, request):
+        encoded = json.dumps(request, sort_keys=True, default=str)
+        digest = hashlib.sha256(encoded.encode()).hexdigest()[:16]
+        return self.directory / f"{namespace}-{digest}.json"
+
+    def _record(self, namespace, request, started, response=None, error=None):
+        interaction = {
+            "request": request,
+            "elapsed": time.monotonic() - started,
+            "response": response,
+            "error": error,
+        }
+        path = self._path(namespace, request)
+        with self._lock:
+            interactions = json.loads(path.read_text()) if path.is_file() else []
+            interactions.append(interaction)
+            path.write_text(json.dumps(interactions, indent=2, default=str))
+
+    def _next_interaction(self, namespace, request):
+        path = self._path(namespace, request)
+        with self._lock:
+            if not path.is_file():
+                raise CassetteMissError(
+                    f"No recorded {namespace} interaction for request: {request}"
+                )
+            interactions = json.loads(path.read_text())
+            position = self._replay_positions.get(path, 0)
+            self._replay_positions[path] = position + 1
+        return interactions[min(position, len(interactions) - 1)]
+
+    def _replay_result(self, interaction, make_error):
+        error = interaction.get("error")
+        if error:
+            raise make_error(error["status"], error["message"], error.get("data"))
+        return interaction["response"]
+
+    async def call_async(self, namespace, request, send, make_error):
+        if self.mode == REPLAY:
+            interaction = self._next_interaction(namespace, request)
+            await asyncio.sleep(interaction["elapsed"] * self.latency_scale)
+            return self._replay_result(interaction, make_error)
+
+        started = time.monotonic()
+        try:
+            response = await send()
+        except Exception as e:
+            if getattr(e, "status", None) is None:
+                raise
+            self._record(namespace, request, started, error=_error_data(e))
+            raise
+        self._record(namespace, request, started, response=response)
+        return response
+
+    def call(self, namespace, request, send, make_error):
+        if self.mode == REPLAY:
+            interaction = self._next_interaction(namespace, request)
+            time.sleep(interaction["elapsed"] * self.latency_scale)
+            return self._replay_result(interaction, make_error)
+
+        started = time.monotonic()
+        try:
+            response = send()
+        except Exception as e:
+            if getattr(e, "status", None) is None:
+                raise
+            self._record(namespace, request, started, error=_error_data(e))
+            raise
+        self._record(namespace, request, started, response=response)
+        return response
+
+
+def _error_data(e):
+    # Only HTTP errors (anything with a status) are recorded and replayed. The
+    # error body is kept so callers can still inspect e.g. GitHub error codes.
+    return {
+        "status": e.status,
+        "message": getattr(e, "message", None) or str(e),
+        "data": getattr(e, "data", None),
+    }
+
+
+def load_cassette():
+    is_prod = os.environ.get("STREAMLIT_ENV", "development") == "production"
+    mode = os.environ.get("CASSETTE_MODE")
+    directory = os.environ.get("CASSETTE_DIR")
+    if is_prod or not mode or not directory:
+        return None
+    latency_scale = float(os.environ.get("CASSETTE_LATENCY_SCALE", 1.0))
+    logging.warning(f"Cassette {mode} mode enabled using {directory}")
+    return Cassette(directory, mode, latency_scale)
@@ -2,10 +2,12 @@ import streamlit as st
 import os
 import json
 import logging
-from github import Auth, Github
+from github_client import GitHubClient
 from greptile import GreptileAPI
 import asyncio
 import aiohttp
+from labels import prepare_labels
+from ticket_editor import assign_ticket_ids, display_ticket_editor
 
 # New prompt string for detailed ticket generation
 DETAILED_TICKET_PROMPT = """
@@ -71,6 +73,7 @@ async def create_detailed_ticket(
         if "tickets" in ticket_data and len(ticket_data["tickets"]) > 0:
             detailed_ticket = ticket_data["tickets"][0]
             detailed_ticket["create_issue"] = True
+            assign_ticket_ids([detailed_ticket])
             logging.warning(
                 f"Successfully created detailed ticket: {detailed_ticket['title']}"
             )
@@ -95,29 +98,26 @@ async def create_detailed_tickets(
     return await asyncio.gather(*tasks)
 
 
-def display_and_edit_detailed_tickets(detailed_tickets, repository, github_token):
+def display_and_edit_detailed_tickets(
+    detailed_tickets, repository, github_token, cassette=None
+):
     st.subheader("Generated Detailed Tickets")
 
-    if "detailed_tickets_response_json" in st.session_state:
-        for i, response_json in enumerate(
-            st.session_state.detailed_tickets_response_json
-        ):
-            with st.expander(f"See Full Response JSON for Ticket {i+1}"):
-                st.json(response_json)
+    responses = st.session_state.get("detailed_tickets_response_json", [])
+    if responses:
+        with st.expander("See Full Response JSON"):
+            # Only render the selected response instead of one per ticket
+            index = st.selectbox(
+                "Response",
+                range(len(responses)),
+                format_func=lambda i: f"Ticket {i+1}",
+                key="detailed_response_json_index",
+            )
+            st.json(responses[index])
 
     st.info("Double-click on a row to edit the ticket.")
 
-    edited_tickets = st.data_editor(
-        detailed_tickets,
-        hide_index=True,
-        column_config={
-            "create_issue": st.column_config.CheckboxColumn("Create?", default=True),
-            "title": st.column_config.TextColumn("Title", width="medium"),
-            "body": st.column_config.TextColumn("Body", width="large"),
-            "labels": st.column_config.ListColumn("Labels", width="medium"),
-        },
-        column_order=["create_issue", "title", "body", "labels"],
-    )
+    edited_tickets = display_ticket_editor(detailed_tickets, key="detailed_tickets")
 
     st.markdown(
         """
@@ -127,26 +127,27 @@ def display_and_edit_detailed_tickets(detailed_tickets, repository, github_token
     )
 
     if st.button("Create Selected Detailed GitHub Issues"):
-        create_github_issues(edited_tickets, repository, github_token)
+        create_github_issues(edited_tickets, repository, github_token, cassette)
 
 
-def create_github_issues(tickets, repository, github_token):
+def create_github_issues(tickets, repository, github_token, cassette=None):
     try:
-        auth = Auth.Token(github_token)
-        g = Github(auth=auth)
-        repo = g.get_repo(repository)
-
-        for ticket in tickets:
-            if ticket.get("create_issue", True):
-                body = (
-                    ticket["body"]
-                    + "\n\n---\nAuto-generated issue using Bulk Ticket Generator 🎫 + Greptile"
-                )
-                issue = repo.create_issue(
-                    title=ticket["title"], body=body, labels=ticket["labels"]
-                )
-                st.success(f"Created detailed issue: {issue.html_url}")
-                logging.warning(f"Created GitHub issue: {issue.html_url}")
+        client = GitHubClient(github_token, repository, cassette)
+
+        selected_tickets = [
+            dict(ticket) for ticket in tickets if ticket.get("create_issue", True)
+        ]
+        with st.spinner("Syncing labels..."):
+            prepare_labels(client, selected_tickets)
+
+        for ticket in selected_tickets:
+            body = (
+                ticket["body"]
+                + "\n\n---\nAuto-generated issue using Bulk Ticket Generator 🎫 + Greptile"
+            )
+            issue_url = client.create_issue(ticket["title"], body, ticket["labels"])
+            st.success(f"Created detailed issue: {issue_url}")
+            logging.warning(f"Created GitHub issue: {issue_url}")
     except Exception as e:
         error_msg = f"An error occurred while creating GitHub issues: {str(e)}"
         st.error(error_msg)
@@ -161,6 +162,7 @@ def display_detailed_tickets(
     remote,
     branch,
     github_token,
+    cassette=None,
 ):
     st.markdown("---")
 
@@ -260,5 +262,5 @@ def display_detailed_tickets(
 
     if st.session_state.detailed_tickets:
         display_and_edit_detailed_tickets(
-            st.session_state.detailed_tickets, repository, github_token
+            st.session_state.detailed_tickets, repository, github_token, cassette
         )
@@ -0,0 +1,63 @@
+from typing import List, Optional
+from github import Auth, Github, GithubException
+from cassette import Cassette
+
+
+class GitHubClient:
+    """The GitHub operations used by the app, returning plain data.
+
+    Keeping results JSON-serializable lets a cassette record and replay them.
+    """
+
+    def __init__(
+        self, github_token: str, repository: str, cassette: Optional[Cassette] = None
+    ):
+        self.github_token = github_token
+        self.repository = repository
+        self.cassette = cassette
+        self._repo = None
+
+    @property
+    def repo(self):
+        # Fetched lazily so replayed runs never contact GitHub
+        if self._repo is None:
+            self._repo = Github(auth=Auth.Token(self.github_token)).get_repo(
+                self.repository
+            )
+        return self._repo
+
+    def _call(self, operation, params, send):
+        if self.cassette is None:
+            return send()
+        request = {"repository": self.repository, "operation": operation, **params}
+        return self.cassette.call(
+            "github",
+            request,
+            send,
+            lambda status, message, data: GithubException(
+                status, data if data is not None else {"message": message}, None
+            ),
+        )
+
+    def get_label_names(self) -> List[str]:
+        return self._call(
+            "get_labels",
+            {},
+            lambda: [label.name for label in self.repo.get_labels()],
+        )
+
+    def create_label(self, name: str, color: str) -> str:
+        return self._call(
+            "create_label",
+            {"name": name, "color": color},
+            lambda: self.repo.create_label(name=name, color=color).name,
+        )
+
+    def create_issue(self, title: str, body: str, labels: List[str]) -> str:
+        return self._call(
+            "create_issue",
+            {"title": title, "body": body, "labels": labels},
+            lambda: self.repo.create_issue(
+                title=title, body=body, labels=labels
+            ).html_url,
+        )
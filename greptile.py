@@ -4,23 +4,38 @@ from typing import List, Dict, Optional
 import urllib.parse
 import aiohttp
 import asyncio
+from cassette import Cassette
+from greptile_service import GreptileService, send_request
 
 
 class GreptileAPI:
-    def __init__(self, greptile_api_key: str, github_token: str):
+    def __init__(
+        self,
+        greptile_api_key: str,
+        github_token: str,
+        service: Optional[GreptileService] = None,
+        cassette: Optional[Cassette] = None,
+    ):
         self.base_url = "https://api.greptile.com/v2"
+        self.service = service
+        self.cassette = cassette
         self.headers = {
             "Authorization": f"Bearer {greptile_api_key}",
             "X-GitHub-Token": github_token,
             "Content-Type": "application/json",
         }
 
+    async def _request(self, method: str, url: str, payload: Optional[Dict] = None):
+        if self.service is not None:
+            return await self.service.request(method, url, self.headers, payload)
+        async with aiohttp.ClientSession() as session:
+            return await send_request(
+                session, method, url, self.headers, payload, self.cassette
+            )
+
     async def get_repository_info(self, repository_id: str) -> Dict:
         url = f"{self.base_url}/repositories/{repository_id}"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=self.headers) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self._request("GET", url)
 
     async def index_repository(self, remote: str, repository: str, branch: str) -> Dict:
         url = f"{self.base_url}/repositories"
@@ -31,12 +46,7 @@ class GreptileAPI:
             "reload": True,
             "notify": True,
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url, json=payload, headers=self.headers
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self._request("POST", url, payload)
 
     async def is_repository_indexed(
         self, remote: str, repository: str, branch: str
@@ -82,12 +92,7 @@ class GreptileAPI:
             "genius": genius,
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url, json=payload, headers=self.headers
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self._request("POST", url, payload)
 
     def query(
         self,
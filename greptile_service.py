@@ -0,0 +1,126 @@
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import aiohttp
+from typing import Optional
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+from cassette import Cassette
+
+MAX_CONCURRENT_REQUESTS = int(os.environ.get("GREPTILE_MAX_CONCURRENT_REQUESTS", 8))
+
+
+def tenant_key(headers):
+    # Credentials are only kept as a hash so tenants never share results
+    credentials = json.dumps(
+        [headers.get("Authorization", ""), headers.get("X-GitHub-Token", "")]
+    )
+    return hashlib.sha256(credentials.encode()).hexdigest()
+
+
+def normalize_payload(payload):
+    if payload and "messages" in payload:
+        # Message ids are random per call and do not change the answer
+        payload = dict(payload)
+        payload["messages"] = [
+            {k: v for k, v in message.items() if k != "id"}
+            for message in payload["messages"]
+        ]
+    return payload
+
+
+def request_key(headers, method, url, payload=None):
+    return (
+        tenant_key(headers),
+        method,
+        url,
+        json.dumps(normalize_payload(payload), sort_keys=True, default=str),
+    )
+
+
+async def send_request(session, method, url, headers, payload=None, cassette=None):
+    """Send one HTTP request, recording or replaying it through `cassette`."""
+
+    async def send():
+        async with session.request(
+            method, url, json=payload, headers=headers
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    if cassette is None:
+        return await send()
+
+    def make_error(status, message, data=None):
+        request_info = aiohttp.RequestInfo(
+            URL(url), method, CIMultiDictProxy(CIMultiDict()), URL(url)
+        )
+        return aiohttp.ClientResponseError(
+            request_info, (), status=status, message=message
+        )
+
+    request = {"method": method, "url": url, "payload": normalize_payload(payload)}
+    return await cassette.call_async("greptile", request, send, make_error)
+
+
+class GreptileService:
+    """Process-wide request layer shared by all Streamlit sessions.
+
+    Every session runs its own event loop, so requests are executed on a
+    single background loop where identical in-flight requests are merged and
+    a global concurrency budget is enforced.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+        cassette: Optional[Cassette] = None,
+    ):
+        self.max_concurrent_requests = max_concurrent_requests
+        self.cassette = cassette
+        self._lock = threading.RLock()
+        self._in_flight = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="greptile-service", daemon=True
+        )
+        self._thread.start()
+        self._semaphore = None
+        self._session = None
+
+    async def _send(self, method, url, headers, payload):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        async with self._semaphore:
+            # Recorded below dedup and the semaphore so timings exclude queueing
+            return await send_request(
+                self._session, method, url, headers, payload, self.cassette
+            )
+
+    async def request(self, method, url, headers, payload=None):
+        key = request_key(headers, method, url, payload)
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is None:
+                future = asyncio.run_coroutine_threadsafe(
+                    self._send(method, url, headers, payload), self._loop
+                )
+                self._in_flight[key] = future
+                future.add_done_callback(lambda _: self._forget(key, future))
+            else:
+                logging.info(f"Sharing in-flight Greptile request: {method} {url}")
+        # Shield so one session giving up does not cancel it for the others
+        response = await asyncio.shield(asyncio.wrap_future(future))
+        # Each waiter gets its own copy since sessions mutate what they store
+        return copy.deepcopy(response)
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
@@ -0,0 +1,171 @@
+import streamlit as st
+import hashlib
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from github import GithubException
+
+MAX_LABEL_WORKERS = 8
+LABEL_CATALOG_TTL = 300
+
+_label_catalogs = {}
+_label_catalogs_lock = threading.Lock()
+
+
+def normalize_label(label):
+    label = re.sub(r"[_\-/]", " ", label.lower())
+    label = re.sub(r"\s*:\s*", ": ", label)
+    return " ".join(label.split())
+
+
+NON_PLURAL_WORDS = {"news", "series", "species", "always", "canvas", "alias", "redis"}
+
+
+def singular_label(normalized):
+    # Returns None unless the last word is a plain "-s" plural such as "bugs"
+    words = normalized.split()
+    if not words:
+        return None
+    word = words[-1]
+    if (
+        len(word) <= 3
+        or not word.endswith("s")
+        or word.endswith(("ss", "us", "is"))
+        or word in NON_PLURAL_WORDS
+    ):
+        return None
+    return " ".join(words[:-1] + [word[:-1]])
+
+
+def label_color(label):
+    # Deterministic color so the same generated label always looks the same
+    return hashlib.sha1(normalize_label(label).encode()).hexdigest()[:6]
+
+
+def catalog_key(client):
+    # Keyed per token so a tenant never sees labels fetched with another's access
+    token_hash = hashlib.sha256(client.github_token.encode()).hexdigest()
+    return token_hash, client.repository
+
+
+def fetch_label_catalog(client):
+    key = catalog_key(client)
+    with _label_catalogs_lock:
+        cached = _label_catalogs.get(key)
+        if cached and time.monotonic() - cached[0] < LABEL_CATALOG_TTL:
+            return list(cached[1])
+    names = client.get_label_names()
+    with _label_catalogs_lock:
+        _label_catalogs[key] = (time.monotonic(), names)
+    return list(names)
+
+
+def add_to_label_catalog(client, names):
+    key = catalog_key(client)
+    with _label_catalogs_lock:
+        cached = _label_catalogs.get(key)
+        if cached:
+            _label_catalogs[key] = (cached[0], cached[1] + list(names))
+
+
+def map_label(label, catalog):
+    if label is None:
+        return None
+    label = str(label).strip()
+    if not label:
+        return None
+    normalized = normalize_label(label)
+    for name in catalog:
+        if normalize_label(name) == normalized:
+            return name
+    # Fold plurals only onto an exact singular/plural counterpart in the catalog
+    singular = singular_label(normalized)
+    for name in catalog:
+        normalized_name = normalize_label(name)
+        if singular is not None and normalized_name == singular:
+            return name
+        if singular_label(normalized_name) == normalized:
+            return name
+    return label
+
+
+def resolve_ticket_labels(tickets, catalog):
+    """Map each ticket's labels onto the catalog in place.
+
+    Returns the labels that do not exist in the repository yet and a dict of
+    generated labels that were remapped onto existing ones.
+    """
+    catalog = list(catalog)
+    new_labels = []
+    remapped = {}
+    for ticket in tickets:
+        resolved = []
+        for label in ticket.get("labels") or []:
+            mapped = map_label(label, catalog)
+            if mapped is None or mapped in resolved:
+                continue
+            if mapped not in catalog:
+                # Later tickets should match against labels we are about to create
+                catalog.append(mapped)
+                new_labels.append(mapped)
+            elif mapped != str(label).strip():
+                remapped[str(label).strip()] = mapped
+            resolved.append(mapped)
+        ticket["labels"] = resolved
+    return new_labels, remapped
+
+
+def create_label(client, name):
+    try:
+        client.create_label(name, label_color(name))
+        logging.warning(f"Created GitHub label: {name}")
+        return name
+    except GithubException as e:
+        # Another session may have created it; any other 422 is an invalid name
+        errors = e.data.get("errors", []) if isinstance(e.data, dict) else []
+        if any(
+            isinstance(error, dict) and error.get("code") == "already_exists"
+            for error in errors
+        ):
+            return name
+        logging.error(f"Failed to create GitHub label {name}: {str(e)}")
+        return None
+
+
+def create_labels(client, names):
+    if not names:
+        return []
+    with ThreadPoolExecutor(max_workers=min(MAX_LABEL_WORKERS, len(names))) as pool:
+        created = pool.map(lambda name: create_label(client, name), names)
+        return [name for name in created if name]
+
+
+def prepare_labels(client, tickets):
+    """Resolve ticket labels and pre-create missing ones before issue creation.
+
+    Labels that could not be created are dropped from the tickets so the
+    issue creation loop does not fail on them.
+    """
+    catalog = fetch_label_catalog(client)
+    new_labels, remapped = resolve_ticket_labels(tickets, catalog)
+    if remapped:
+        st.toast(
+            "Mapped labels: "
+            + ", ".join(f"{label} → {name}" for label, name in remapped.items())
+        )
+
+    created = create_labels(client, new_labels)
+    if created:
+        add_to_label_catalog(client, created)
+        st.toast(f"Created {len(created)} new label(s).")
+
+    failed = set(new_labels) - set(created)
+    if failed:
+        st.warning(f"Could not create labels: {', '.join(sorted(failed))}")
+        for ticket in tickets:
+            ticket["labels"] = [
+                label for label in ticket["labels"] if label not in failed
+            ]
+    return tickets
@@ -1,5 +1,7 @@
 import streamlit as st
 from greptile import GreptileAPI
+from greptile_service import GreptileService
+from cassette import load_cassette
 import os
 import asyncio
 from ticket_list import create_ticket_list, display_and_edit_tickets
@@ -66,8 +68,23 @@ with col2:
 with col3:
     branch = st.text_input("Branch", value="main")
 
+
+@st.cache_resource
+def get_cassette():
+    # Record/replay for load testing, configured via CASSETTE_MODE/CASSETTE_DIR
+    return load_cassette()
+
+
+@st.cache_resource
+def get_greptile_service():
+    # Shared by every session in this process
+    return GreptileService(cassette=get_cassette())
+
+
 greptile = GreptileAPI(
-    st.session_state.greptile_api_key_input, st.session_state.github_token_input
+    st.session_state.greptile_api_key_input,
+    st.session_state.github_token_input,
+    service=get_greptile_service(),
 )
 
 
@@ -167,6 +184,7 @@ display_detailed_tickets(
     remote,
     branch,
     st.session_state.github_token_input,
+    get_cassette(),
 )
 
 st.markdown("---")
@@ -0,0 +1,136 @@
+import asyncio
+import urllib.parse
+import aiohttp
+import pytest
+from github import GithubException
+import labels
+from cassette import Cassette, RECORD, REPLAY
+from github_client import GitHubClient
+from greptile import GreptileAPI
+from greptile_service import send_request
+
+ALREADY_EXISTS = {
+    "message": "Validation Failed",
+    "errors": [{"resource": "Label", "code": "already_exists", "field": "name"}],
+}
+
+
+class FakeLabel:
+    def __init__(self, name):
+        self.name = name
+
+
+class FakeIssue:
+    def __init__(self, number):
+        self.html_url = f"https://github.com/o/r/issues/{number}"
+
+
+class FakeRepo:
+    def __init__(self):
+        self.issues = []
+
+    def get_labels(self):
+        return [FakeLabel("bug")]
+
+    def create_label(self, name, color):
+        # Simulates another session creating the label first
+        raise GithubException(422, ALREADY_EXISTS, None)
+
+    def create_issue(self, title, body, labels):
+        self.issues.append((title, body, labels))
+        return FakeIssue(len(self.issues))
+
+
+class OfflineRepo:
+    def __getattr__(self, name):
+        raise AssertionError("replay must not contact GitHub")
+
+
+def create_issues(client):
+    labels._label_catalogs.clear()
+    tickets = [{"title": "Speed up", "body": "Body", "labels": ["Bugs", "perf"]}]
+    labels.prepare_labels(client, tickets)
+    return [
+        client.create_issue(ticket["title"], ticket["body"], ticket["labels"])
+        for ticket in tickets
+    ], tickets
+
+
+def test_github_round_trip(tmp_path):
+    client = GitHubClient("token", "o/r", Cassette(tmp_path, RECORD))
+    client._repo = FakeRepo()
+    recorded_urls, recorded_tickets = create_issues(client)
+    assert recorded_tickets[0]["labels"] == ["bug", "perf"]
+
+    client = GitHubClient("token", "o/r", Cassette(tmp_path, REPLAY, 0))
+    client._repo = OfflineRepo()
+    replayed_urls, replayed_tickets = create_issues(client)
+
+    assert replayed_urls == recorded_urls
+    assert replayed_tickets == recorded_tickets
+
+
+class FakeResponse:
+    def __init__(self, method, url, status, body):
+        self.method = method
+        self.url = url
+        self.status = status
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                aiohttp.RequestInfo(self.url, self.method, {}, self.url),
+                (),
+                status=self.status,
+                message="Not Found",
+            )
+
+    async def json(self):
+        return self.body
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = responses
+
+    def request(self, method, url, json=None, headers=None):
+        status, body = self.responses[url]
+        return FakeResponse(method, url, status, body)
+
+
+def test_greptile_round_trip(tmp_path):
+    greptile = GreptileAPI("key", "token")
+    indexed_id = urllib.parse.quote_plus("github:main:o/indexed")
+    missing_id = urllib.parse.quote_plus("github:main:o/missing")
+    indexed_url = f"{greptile.base_url}/repositories/{indexed_id}"
+    missing_url = f"{greptile.base_url}/repositories/{missing_id}"
+    session = FakeSession(
+        {indexed_url: (200, {"status": "completed"}), missing_url: (404, None)}
+    )
+
+    async def record():
+        cassette = Cassette(tmp_path, RECORD)
+        await send_request(session, "GET", indexed_url, greptile.headers, None, cassette)
+        with pytest.raises(aiohttp.ClientResponseError):
+            await send_request(
+                session, "GET", missing_url, greptile.headers, None, cassette
+            )
+
+    asyncio.run(record())
+
+    greptile.cassette = Cassette(tmp_path, REPLAY, 0)
+
+    async def replay():
+        return (
+            await greptile.is_repository_indexed("github", "o/indexed", "main"),
+            await greptile.is_repository_indexed("github", "o/missing", "main"),
+        )
+
+    assert asyncio.run(replay()) == (True, False)
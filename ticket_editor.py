@@ -0,0 +1,170 @@
+import streamlit as st
+import uuid
+
+PAGE_SIZE_OPTIONS = [10, 25, 50, 100]
+BODY_PREVIEW_LENGTH = 120
+
+STATUS_ALL = "All"
+STATUS_SELECTED = "Selected"
+STATUS_UNSELECTED = "Not selected"
+
+TICKET_ID_KEY = "_ticket_id"
+
+
+def assign_ticket_ids(tickets):
+    # Always use our own IDs: parsed LLM output may carry duplicate or non-string ids
+    for ticket in tickets:
+        ticket[TICKET_ID_KEY] = uuid.uuid4().hex
+    return tickets
+
+
+def ensure_ticket_ids(tickets):
+    # Stable IDs let edits on a filtered/paginated view be merged back by ticket
+    for ticket in tickets:
+        if not ticket.get(TICKET_ID_KEY):
+            ticket[TICKET_ID_KEY] = uuid.uuid4().hex
+    return tickets
+
+
+def body_preview(body, length=BODY_PREVIEW_LENGTH):
+    body = " ".join((body or "").split())
+    if len(body) <= length:
+        return body
+    return body[: length - 1] + "…"
+
+
+def filter_tickets(tickets, labels=None, status=STATUS_ALL, search=""):
+    search = (search or "").strip().lower()
+    filtered = []
+    for ticket in tickets:
+        if labels and not set(labels) & set(ticket.get("labels") or []):
+            continue
+        if status == STATUS_SELECTED and not ticket.get("create_issue", True):
+            continue
+        if status == STATUS_UNSELECTED and ticket.get("create_issue", True):
+            continue
+        if search and not (
+            search in (ticket.get("title") or "").lower()
+            or search in (ticket.get("body") or "").lower()
+        ):
+            continue
+        filtered.append(ticket)
+    return filtered
+
+
+def paginate(items, page, page_size):
+    num_pages = max(1, (len(items) + page_size - 1) // page_size)
+    page = min(max(1, page), num_pages)
+    start = (page - 1) * page_size
+    return items[start : start + page_size], page, num_pages
+
+
+def merge_edited_rows(tickets, edited_rows):
+    by_id = {ticket[TICKET_ID_KEY]: ticket for ticket in tickets}
+    for row in edited_rows:
+        ticket = by_id.get(row.get(TICKET_ID_KEY))
+        if ticket is None:
+            continue
+        ticket["create_issue"] = bool(row.get("create_issue", True))
+        ticket["title"] = row.get("title") or ""
+        ticket["labels"] = list(row.get("labels") or [])
+    return tickets
+
+
+def display_ticket_editor(tickets, key):
+    """Edit `tickets` in place, shipping only the visible page to the browser.
+
+    Bodies are sent as short previews; the full body of a single ticket is
+    loaded on demand in the expander below the table.
+    """
+    ensure_ticket_ids(tickets)
+
+    all_labels = sorted({label for t in tickets for label in (t.get("labels") or [])})
+
+    col1, col2, col3 = st.columns([2, 1, 2])
+    with col1:
+        label_filter = st.multiselect(
+            "Filter by label", all_labels, key=f"{key}_label_filter"
+        )
+    with col2:
+        status_filter = st.selectbox(
+            "Status",
+            [STATUS_ALL, STATUS_SELECTED, STATUS_UNSELECTED],
+            key=f"{key}_status_filter",
+        )
+    with col3:
+        search = st.text_input(
+            "Search", placeholder="Title or body text", key=f"{key}_search"
+        )
+
+    filtered = filter_tickets(tickets, label_filter, status_filter, search)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        page_size = st.selectbox(
+            "Tickets per page", PAGE_SIZE_OPTIONS, key=f"{key}_page_size"
+        )
+    num_pages = max(1, (len(filtered) + page_size - 1) // page_size)
+    page_key = f"{key}_page"
+    # Clamp before rendering, filters or page size may have shrunk the page count
+    if st.session_state.get(page_key, 1) > num_pages:
+        st.session_state[page_key] = num_pages
+    with col2:
+        page = st.number_input(
+            "Page", min_value=1, max_value=num_pages, step=1, key=page_key
+        )
+
+    visible, page, num_pages = paginate(filtered, page, page_size)
+    st.caption(
+        f"Page {page} of {num_pages}. Showing {len(visible)} of {len(filtered)} "
+        f"filtered tickets ({len(tickets)} total)."
+    )
+
+    rows = [
+        {
+            TICKET_ID_KEY: ticket[TICKET_ID_KEY],
+            "create_issue": ticket.get("create_issue", True),
+            "title": ticket.get("title", ""),
+            "body_preview": body_preview(ticket.get("body")),
+            "labels": ticket.get("labels") or [],
+        }
+        for ticket in visible
+    ]
+
+    # Key on the visible set so stale row deltas never apply to another page
+    view_key = f"{key}_editor_{page}_{page_size}_" + ",".join(
+        row[TICKET_ID_KEY] for row in rows
+    )
+    edited_rows = st.data_editor(
+        rows,
+        key=view_key,
+        hide_index=True,
+        disabled=[TICKET_ID_KEY, "body_preview"],
+        column_config={
+            "create_issue": st.column_config.CheckboxColumn("Create?", default=True),
+            "title": st.column_config.TextColumn("Title", width="medium"),
+            "body_preview": st.column_config.TextColumn("Body", width="large"),
+            "labels": st.column_config.ListColumn("Labels", width="medium"),
+        },
+        column_order=["create_issue", "title", "body_preview", "labels"],
+    )
+    merge_edited_rows(tickets, edited_rows)
+
+    if visible:
+        with st.expander("Edit full ticket body"):
+            by_id = {ticket[TICKET_ID_KEY]: ticket for ticket in visible}
+            ticket_id = st.selectbox(
+                "Ticket",
+                list(by_id.keys()),
+                format_func=lambda i: by_id[i].get("title") or i,
+                key=f"{key}_body_ticket",
+            )
+            ticket = by_id[ticket_id]
+            ticket["body"] = st.text_area(
+                "Body",
+                value=ticket.get("body", ""),
+                height=300,
+                key=f"{key}_body_{ticket_id}",
+            )
+
+    return tickets
@@ -5,6 +5,7 @@ import json
 import logging
 import asyncio
 from pathlib import Path
+from ticket_editor import assign_ticket_ids, display_ticket_editor
 
 
 async def create_ticket_list(
@@ -115,6 +116,7 @@ async def create_ticket_list(
 
             for ticket in tickets:
                 ticket["create_issue"] = True
+            assign_ticket_ids(tickets)
 
             logging.warning(f"Successfully extracted {len(tickets)} tickets")
             return tickets
@@ -143,17 +145,7 @@ def display_and_edit_tickets(tickets):
 
     st.info("Double-click on a row to edit the ticket.")
 
-    edited_tickets = st.data_editor(
-        tickets,
-        hide_index=True,
-        column_config={
-            "create_issue": st.column_config.CheckboxColumn("Create?", default=True),
-            "title": st.column_config.TextColumn("Title", width="medium"),
-            "body": st.column_config.TextColumn("Body", width="large"),
-            "labels": st.column_config.ListColumn("Labels", width="medium"),
-        },
-        column_order=["create_issue", "title", "body", "labels"],
-    )
+    edited_tickets = display_ticket_editor(tickets, key="ticket_list")
 
     st.session_state.edited_tickets = edited_tickets
 